@@ -119,4 +119,24 @@ class BinanceClient:
             raise
         except Exception as e:
             logger.error(f"Error fetching account balance: {e}")
-            raise
\ No newline at end of file
+            raise
+    
+    def get_ticker_prices(self):
+        """
+        Get latest prices for all futures symbols in a single request.
+        Returns:
+            Dictionary mapping symbol to (price, timestamp in seconds)
+        """
+        try:
+            logger.debug("Fetching ticker prices")
+            tickers = self.client.futures_symbol_ticker()
+            return {
+                t['symbol']: (float(t['price']), t.get('time', 0) / 1000.0)
+                for t in tickers
+            }
+        except BinanceAPIException as e:
+            logger.error(f"API Error fetching ticker prices: {e.message}")
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching ticker prices: {e}")
+            raise
@@ -0,0 +1,527 @@
+"""
+Multi-symbol strategy runner.
+Shards strategies across worker processes that read prices from shared
+memory and send order intents to a single order gateway process.
+"""
+import multiprocessing as mp
+import os
+import queue
+import signal
+import time
+from multiprocessing import shared_memory
+from typing import Dict, List
+from bot.logging_config import get_logger
+from bot.strategy import OrderIntent, load_strategy
+from bot.validators import validate_order_params, ValidationError
+
+logger = get_logger(__name__)
+
+# Seconds a worker sleeps when none of its symbols has a new price
+WORKER_POLL_INTERVAL = 0.05
+
+# Intents waiting for the gateway; workers drop new intents when it is full
+INTENT_QUEUE_SIZE = 100
+
+# Attempts to read a slot that is being written before giving up
+READ_RETRIES = 100
+
+
+class MarketDataBoard:
+    """
+    Latest price per symbol, held in shared memory.
+
+    Each symbol owns a slot of three doubles: sequence number, price and
+    timestamp. The single writer (the gateway) makes the sequence odd while
+    it updates a slot, so readers retry instead of seeing a torn value. A
+    slot that stays odd (e.g. the writer died mid-update) reads as no data.
+    """
+
+    SLOT_SIZE = 3
+
+    def __init__(self, symbols: List[str], name: str = None):
+        """
+        Create a new board, or attach to an existing one by name.
+
+        Args:
+            symbols: Symbols in slot order (must match across processes)
+            name: Shared memory block to attach to (creates one if None)
+        """
+        self.symbols = list(symbols)
+        self.slots = {symbol: i for i, symbol in enumerate(self.symbols)}
+        size = len(self.symbols) * self.SLOT_SIZE * 8
+
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+
+        self.data = self.shm.buf.cast("d")
+        if self.owner:
+            for i in range(len(self.data)):
+                self.data[i] = 0.0
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def publish(self, symbol: str, price: float, timestamp: float):
+        """Write the latest price for a symbol."""
+        base = self.slots[symbol] * self.SLOT_SIZE
+        seq = self.data[base]
+        self.data[base] = seq + 1
+        self.data[base + 1] = price
+        self.data[base + 2] = timestamp
+        self.data[base] = seq + 2
+
+    def read(self, symbol: str):
+        """
+        Read the latest price for a symbol.
+
+        Returns:
+            Tuple of (sequence, price, timestamp); sequence is 0 until the
+            first price is published. None if the slot is still being
+            written after READ_RETRIES attempts.
+        """
+        base = self.slots[symbol] * self.SLOT_SIZE
+        for _ in range(READ_RETRIES):
+            seq = self.data[base]
+            if not seq % 2:
+                price = self.data[base + 1]
+                timestamp = self.data[base + 2]
+                if self.data[base] == seq:
+                    return seq, price, timestamp
+            # Let the writer finish
+            time.sleep(0)
+        return None
+
+    def close(self):
+        """Detach from the shared memory block, freeing it if we created it."""
+        self.data.release()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+class RateLimiter:
+    """
+    Token bucket limiting how many orders are sent per second.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.clock = clock
+        self.tokens = float(self.capacity)
+        self.updated = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available, without blocking."""
+        self._refill()
+        # Allow for float rounding so a refill that is due is never missed
+        if self.tokens >= 1 - 1e-9:
+            self.tokens = max(0.0, self.tokens - 1)
+            return True
+        return False
+
+    def delay(self) -> float:
+        """Seconds until the next token is available."""
+        self._refill()
+        if self.tokens >= 1 - 1e-9:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+def shard_symbols(symbols: List[str], workers: int) -> List[List[str]]:
+    """
+    Split symbols round-robin across workers.
+
+    Returns:
+        One non-empty list of symbols per worker
+    """
+    workers = max(1, min(workers, len(symbols)))
+    return [symbols[i::workers] for i in range(workers)]
+
+
+def connect_binance():
+    """
+    Connect to Binance for the order gateway.
+
+    Returns:
+        Tuple of (BinanceClient, OrderManager)
+    """
+    # Imported here so the runner can be used with a stub connect without python-binance
+    from bot.client import BinanceClient
+    from bot.orders import OrderManager
+
+    client = BinanceClient()
+    return client, OrderManager(client)
+
+
+class OrderGateway:
+    """
+    Polls prices into the market data board and places order intents.
+
+    Price polling runs on its own schedule: an intent waiting for the rate
+    limit is held (not slept on) while polling continues, and intents older
+    than max_intent_age seconds are dropped instead of being sent late.
+    Every intent gets a (key, intent, response, error) result on the results
+    queue of the worker that sent it, where key is the symbol of the strategy
+    that emitted it (which may differ from intent.symbol).
+    """
+
+    def __init__(self, client, order_manager, board: MarketDataBoard, results: list,
+                 interval: float, max_orders_per_second: float,
+                 max_intent_age: float = None, clock=time.monotonic, sleep=time.sleep):
+        """
+        Initialize gateway.
+
+        Args:
+            client: BinanceClient used for price polling
+            order_manager: OrderManager used to place orders
+            board: Market data board to publish prices to
+            results: Result queue per worker, indexed by worker id
+            interval: Seconds between price polls
+            max_orders_per_second: Order rate limit
+            max_intent_age: Seconds after which an unsent intent is dropped
+                (defaults to interval)
+            clock: Monotonic clock used for the poll schedule and rate limit
+            sleep: Sleep function matching clock
+        """
+        self.client = client
+        self.order_manager = order_manager
+        self.board = board
+        self.results = results
+        self.interval = interval
+        self.clock = clock
+        self.sleep = sleep
+        self.limiter = RateLimiter(max_orders_per_second, clock=clock)
+        self.max_intent_age = max_intent_age or interval
+        self.pending = None
+        self.missing = set()
+
+    def poll_prices(self):
+        """Fetch the latest prices and publish them to the board."""
+        try:
+            prices = self.client.get_ticker_prices()
+        except Exception as e:
+            logger.error(f"Price poll failed: {e}")
+            return
+
+        for symbol in self.board.symbols:
+            if symbol in prices:
+                self.board.publish(symbol, *prices[symbol])
+                self.missing.discard(symbol)
+            elif symbol not in self.missing:
+                self.missing.add(symbol)
+                logger.warning(f"No price received for {symbol}")
+
+    def _reply(self, worker: int, key: str, intent: OrderIntent,
+               response: dict = None, error: str = None):
+        self.results[worker].put((key, intent, response, error))
+
+    def accept(self, worker: int, key: str, intent: OrderIntent) -> bool:
+        """
+        Validate an intent and hold it until the rate limit allows sending.
+
+        Args:
+            worker: Id of the worker that sent the intent
+            key: Symbol of the strategy that emitted the intent
+            intent: Order intent to place
+
+        Returns:
+            True if the intent was accepted, False if it was dropped
+        """
+        try:
+            params = validate_order_params(
+                intent.symbol,
+                intent.side,
+                intent.order_type,
+                str(intent.quantity),
+                None if intent.price is None else str(intent.price)
+            )
+        except ValidationError as e:
+            logger.error(f"Rejected order intent {intent}: {e}")
+            self._reply(worker, key, intent, error=str(e))
+            return False
+
+        self.pending = (worker, key, intent, params)
+        return True
+
+    def send_pending(self) -> bool:
+        """
+        Place the held intent if a rate-limit token is free.
+
+        Returns:
+            True if no intent is held any more (sent or dropped)
+        """
+        worker, key, intent, params = self.pending
+        age = time.time() - intent.created
+        if age > self.max_intent_age:
+            logger.warning(f"Dropped stale order intent ({age:.2f}s old): {intent}")
+            self.pending = None
+            self._reply(worker, key, intent, error=f"Intent expired after {age:.2f}s")
+            return True
+
+        if not self.limiter.try_acquire():
+            return False
+
+        self.pending = None
+        try:
+            response = self.order_manager.place_order(*params)
+        except Exception as e:
+            logger.error(f"Order intent {intent} failed: {e}")
+            self._reply(worker, key, intent, error=str(e))
+        else:
+            self._reply(worker, key, intent, response=response)
+        return True
+
+    def run(self, intents, stop_event):
+        """Poll prices and place intents until stop_event is set."""
+        next_poll = 0.0
+        while not stop_event.is_set():
+            now = self.clock()
+            if now >= next_poll:
+                next_poll = now + self.interval
+                self.poll_prices()
+
+            if self.pending is None:
+                try:
+                    worker, key, intent = intents.get(
+                        timeout=max(0.0, next_poll - self.clock())
+                    )
+                except queue.Empty:
+                    continue
+                if not self.accept(worker, key, intent):
+                    continue
+
+            if not self.send_pending():
+                # get() may have used up most of the interval
+                self.sleep(min(self.limiter.delay(), max(0.0, next_poll - self.clock())))
+
+
+def run_gateway(board_name: str, symbols: List[str], intents, results: list, stop_event,
+                ready_event, interval: float, max_orders_per_second: float,
+                connect=connect_binance):
+    """
+    Order gateway process.
+
+    Owns the Binance connection: `connect` returns the client and order
+    manager, which are used by an OrderGateway until stop_event is set.
+    """
+    # Shutdown is driven by the parent through stop_event
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    board = MarketDataBoard(symbols, name=board_name)
+    try:
+        client, order_manager = connect()
+        gateway = OrderGateway(client, order_manager, board, results,
+                               interval, max_orders_per_second)
+        ready_event.set()
+        logger.info(f"Order gateway started (pid {os.getpid()})")
+        gateway.run(intents, stop_event)
+    except Exception as e:
+        logger.error(f"Order gateway error: {e}")
+        raise
+    finally:
+        stop_event.set()
+        # Don't block exit on results nobody will read
+        for q in results:
+            q.cancel_join_thread()
+        board.close()
+        logger.info("Order gateway stopped")
+
+
+def _notify(strategy, intent: OrderIntent, response: dict, error: str):
+    """Pass an order result to a strategy, logging any error it raises."""
+    try:
+        strategy.on_order_result(intent, response, error)
+    except Exception as e:
+        logger.error(f"Strategy error on {intent.symbol} order result: {e}", exc_info=True)
+
+
+def run_worker(board_name: str, symbols: List[str], shard: List[str], strategy_spec: str,
+               quantity: float, worker_id: int, intents, results, stop_event,
+               poll_interval: float):
+    """
+    Strategy worker process.
+
+    Runs one strategy instance per symbol in its shard, feeding each new
+    price from the market data board and forwarding the resulting intents.
+    Order results from the gateway are passed back to on_order_result().
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    strategy_class = load_strategy(strategy_spec)
+    try:
+        strategies = {symbol: strategy_class(symbol, quantity) for symbol in shard}
+    except Exception as e:
+        logger.error(f"Failed to create {strategy_spec} strategies: {e}")
+        raise
+    last_seq: Dict[str, float] = {symbol: 0.0 for symbol in shard}
+    board = MarketDataBoard(symbols, name=board_name)
+    logger.info(f"Strategy worker started (pid {os.getpid()}) for {', '.join(shard)}")
+
+    try:
+        while not stop_event.is_set():
+            updated = False
+            while True:
+                try:
+                    key, intent, response, error = results.get_nowait()
+                except queue.Empty:
+                    break
+                _notify(strategies[key], intent, response, error)
+
+            for symbol, strategy in strategies.items():
+                snapshot = board.read(symbol)
+                if snapshot is None or snapshot[0] == last_seq[symbol]:
+                    continue
+                seq, price, timestamp = snapshot
+                last_seq[symbol] = seq
+                updated = True
+
+                try:
+                    for intent in strategy.on_tick(price, timestamp) or []:
+                        logger.info(f"Intent from {strategy_class.__name__}: {intent}")
+                        try:
+                            intents.put_nowait((worker_id, symbol, intent))
+                        except queue.Full:
+                            logger.warning(f"Intent queue full, dropped order intent: {intent}")
+                            _notify(strategy, intent, None, "Intent queue full")
+                except Exception as e:
+                    logger.error(f"Strategy error on {symbol}: {e}", exc_info=True)
+
+            if not updated:
+                time.sleep(poll_interval)
+    finally:
+        intents.cancel_join_thread()
+        board.close()
+        logger.info(f"Strategy worker stopped (pid {os.getpid()})")
+
+
+class StrategyRunner:
+    """
+    Runs a strategy over many symbols using a pool of worker processes.
+
+    Layout:
+        gateway process  -> polls prices into shared memory, places orders
+        worker processes -> run strategies for their shard of symbols
+        intent queue     -> carries order intents from workers to gateway
+        result queues    -> carry order results back to each worker
+    """
+
+    def __init__(self, symbols: List[str], strategy_spec: str, quantity: float,
+                 workers: int = None, interval: float = 1.0,
+                 max_orders_per_second: float = 5.0, connect=connect_binance):
+        """
+        Initialize runner.
+
+        Args:
+            symbols: Symbols to trade
+            strategy_spec: Strategy to run, as module:ClassName
+            quantity: Default order quantity passed to each strategy
+            workers: Number of worker processes (defaults to CPU count)
+            interval: Seconds between price polls
+            max_orders_per_second: Order rate limit enforced by the gateway
+            connect: Callable returning (client, order_manager), run inside
+                the gateway process
+        """
+        if not symbols:
+            raise ValueError("At least one symbol is required")
+        if workers is not None and workers < 1:
+            raise ValueError(f"Workers must be at least 1. Got: {workers}")
+        if interval <= 0:
+            raise ValueError(f"Interval must be positive. Got: {interval}")
+        if max_orders_per_second <= 0:
+            raise ValueError(f"Order rate must be positive. Got: {max_orders_per_second}")
+
+        # Fail fast on a bad spec before any process is started
+        load_strategy(strategy_spec)
+
+        self.symbols = list(dict.fromkeys(symbols))
+        self.strategy_spec = strategy_spec
+        self.quantity = quantity
+        self.shards = shard_symbols(self.symbols, workers or os.cpu_count() or 1)
+        self.interval = interval
+        self.max_orders_per_second = max_orders_per_second
+        self.connect = connect
+
+    def run(self):
+        """
+        Start the gateway and workers and block until stopped.
+
+        Returns normally on KeyboardInterrupt.
+
+        Raises:
+            RuntimeError: If the gateway or a worker fails
+        """
+        board = MarketDataBoard(self.symbols)
+        intents = mp.Queue(INTENT_QUEUE_SIZE)
+        results = [mp.Queue() for _ in self.shards]
+        stop_event = mp.Event()
+        ready_event = mp.Event()
+
+        gateway = mp.Process(
+            target=run_gateway,
+            name="order-gateway",
+            args=(board.name, self.symbols, intents, results, stop_event, ready_event,
+                  self.interval, self.max_orders_per_second, self.connect)
+        )
+        workers = [
+            mp.Process(
+                target=run_worker,
+                name=f"strategy-worker-{i}",
+                args=(board.name, self.symbols, shard, self.strategy_spec,
+                      self.quantity, i, intents, results[i], stop_event,
+                      WORKER_POLL_INTERVAL)
+            )
+            for i, shard in enumerate(self.shards)
+        ]
+
+        logger.info(
+            f"Starting {self.strategy_spec} on {len(self.symbols)} symbols "
+            f"with {len(workers)} workers"
+        )
+        processes = [gateway]
+        interrupted = False
+        try:
+            gateway.start()
+            while not ready_event.wait(0.5):
+                if not gateway.is_alive():
+                    raise RuntimeError("Order gateway failed to start, see log for details")
+
+            for worker in workers:
+                worker.start()
+                processes.append(worker)
+
+            # Only a failing child sets stop_event (the gateway does on error)
+            while not stop_event.is_set() and all(p.is_alive() for p in processes):
+                stop_event.wait(0.5)
+            logger.error("A runner process exited unexpectedly, shutting down")
+        except KeyboardInterrupt:
+            interrupted = True
+            logger.info("Interrupted, shutting down")
+        finally:
+            stop_event.set()
+            for p in processes:
+                p.join(timeout=5)
+                if p.is_alive():
+                    logger.warning(f"{p.name} did not stop, terminating")
+                    p.terminate()
+                    p.join()
+            intents.close()
+            for q in results:
+                q.close()
+            board.close()
+            logger.info("Strategy runner stopped")
+
+        if not interrupted:
+            failed = [f"{p.name} (exit code {p.exitcode})" for p in processes if p.exitcode != 0]
+            raise RuntimeError(
+                "Strategy runner stopped after a process failed: "
+                f"{', '.join(failed) or 'unknown'}. See log for details"
+            )
@@ -0,0 +1,162 @@
+"""
+Strategy plugin interface for the strategy runner.
+Strategies consume price ticks and emit order intents.
+"""
+import importlib
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List, Optional
+from bot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class OrderIntent:
+    """
+    Request to place an order, produced by a strategy.
+    Intents are validated and executed by the order gateway process, which
+    drops any intent older than its maximum age (creation time is wall clock).
+    """
+    symbol: str
+    side: str
+    order_type: str
+    quantity: float
+    price: Optional[float] = None
+    created: float = field(default_factory=time.time)
+
+
+class Strategy:
+    """
+    Base class for strategy plugins.
+
+    One instance is created per symbol inside a worker process. Subclasses
+    implement on_tick() and return the order intents to send, if any.
+
+    Intents are asynchronous: every intent is later reported to
+    on_order_result(), either with the exchange response or with an error
+    (rejected, expired, failed or dropped). A response means the order was
+    accepted by the exchange, not that it was filled. Strategies that track
+    positions should update them there, not when emitting the intent.
+    """
+
+    def __init__(self, symbol: str, quantity: float):
+        """
+        Initialize strategy.
+
+        Args:
+            symbol: Trading pair symbol this instance trades
+            quantity: Default order quantity
+        """
+        self.symbol = symbol
+        self.quantity = quantity
+
+    def on_tick(self, price: float, timestamp: float) -> List[OrderIntent]:
+        """
+        Handle a new price for this strategy's symbol.
+
+        Args:
+            price: Latest traded price
+            timestamp: Price time in seconds since the epoch
+
+        Returns:
+            List of order intents (empty if no action)
+        """
+        raise NotImplementedError
+
+    def on_order_result(self, intent: OrderIntent, response: Optional[dict],
+                        error: Optional[str]):
+        """
+        Handle the outcome of an order intent emitted by this strategy.
+
+        Args:
+            intent: The intent that was emitted
+            response: Order response from the exchange (None on error)
+            error: Reason the order was not placed (None on success)
+        """
+        pass
+
+    def market(self, side: str, quantity: float = None) -> OrderIntent:
+        """Build a MARKET order intent for this strategy's symbol."""
+        return OrderIntent(self.symbol, side, "MARKET", quantity or self.quantity)
+
+    def limit(self, side: str, price: float, quantity: float = None) -> OrderIntent:
+        """Build a LIMIT order intent for this strategy's symbol."""
+        return OrderIntent(self.symbol, side, "LIMIT", quantity or self.quantity, price)
+
+
+class SMACrossStrategy(Strategy):
+    """
+    Example strategy: simple moving average crossover.
+    Buys when the fast average crosses above the slow one and sells on the
+    opposite cross. The position only changes once the order is accepted,
+    and no new order is sent while one is outstanding.
+    """
+
+    def __init__(self, symbol: str, quantity: float, fast: int = 5, slow: int = 20):
+        super().__init__(symbol, quantity)
+        if not 0 < fast < slow:
+            raise ValueError(
+                f"SMA periods must satisfy 0 < fast < slow. Got: fast={fast}, slow={slow}"
+            )
+        self.fast = fast
+        self.slow = slow
+        self.prices = deque(maxlen=slow)
+        self.position = None
+        self.pending = False
+
+    def on_tick(self, price: float, timestamp: float) -> List[OrderIntent]:
+        self.prices.append(price)
+        if self.pending or len(self.prices) < self.slow:
+            return []
+
+        prices = list(self.prices)
+        fast_avg = sum(prices[-self.fast:]) / self.fast
+        slow_avg = sum(prices) / self.slow
+
+        if fast_avg > slow_avg and self.position != "LONG":
+            self.pending = True
+            return [self.market("BUY")]
+        if fast_avg < slow_avg and self.position == "LONG":
+            self.pending = True
+            return [self.market("SELL")]
+        return []
+
+    def on_order_result(self, intent: OrderIntent, response: Optional[dict],
+                        error: Optional[str]):
+        self.pending = False
+        if error:
+            logger.warning(f"{self.symbol} {intent.side} order not placed: {error}")
+            return
+        self.position = "LONG" if intent.side == "BUY" else None
+
+
+def load_strategy(spec: str) -> type:
+    """
+    Load a strategy class from a "module:ClassName" spec.
+
+    Args:
+        spec: Import path, e.g. bot.strategy:SMACrossStrategy
+
+    Returns:
+        Strategy subclass
+
+    Raises:
+        ValueError: If the spec is malformed or does not name a Strategy
+    """
+    module_name, sep, class_name = spec.partition(":")
+    if not sep or not module_name or not class_name:
+        raise ValueError(f"Invalid strategy: {spec}. Expected format module:ClassName")
+
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        raise ValueError(f"Cannot import strategy module {module_name}: {e}")
+
+    strategy_class = getattr(module, class_name, None)
+    if not isinstance(strategy_class, type) or not issubclass(strategy_class, Strategy):
+        raise ValueError(f"{spec} is not a Strategy subclass")
+
+    logger.debug(f"Loaded strategy {spec}")
+    return strategy_class
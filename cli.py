@@ -1,19 +1,23 @@
 
 """
 CLI entry point for the trading bot.
-Provides command-line interface for placing orders on Binance Futures Testnet.
+Provides command-line interface for placing orders and running strategies
+on Binance Futures Testnet.
 """
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from typing import Optional
+from typing import List, Optional
 import sys
 
 from bot.logging_config import setup_logging, get_logger
 from bot.client import BinanceClient
 from bot.orders import OrderManager
-from bot.validators import validate_order_params, ValidationError
+from bot.runner import StrategyRunner
+from bot.validators import (
+    validate_order_params, validate_quantity, validate_symbol, ValidationError
+)
 
 # Initialize Typer app and Rich console
 app = typer.Typer(
@@ -179,6 +183,104 @@ def balance():
         console.print()
         sys.exit(1)
 
+@app.command()
+def run(
+    symbols: List[str] = typer.Option(..., "--symbol", "-s", help="Symbol to trade (repeat for multiple symbols)"),
+    strategy: str = typer.Option("bot.strategy:SMACrossStrategy", "--strategy", help="Strategy class as module:ClassName"),
+    quantity: str = typer.Option(..., "--quantity", "-q", help="Default order quantity"),
+    workers: Optional[int] = typer.Option(None, "--workers", "-w", help="Number of strategy worker processes (default: CPU count)"),
+    interval: float = typer.Option(1.0, "--interval", "-i", help="Seconds between price updates"),
+    max_orders_per_second: float = typer.Option(5.0, "--max-orders-per-second", help="Order rate limit"),
+):
+    """
+    Run an automated strategy on one or more symbols.
+    Examples:
+        python cli.py run -s BTCUSDT -s ETHUSDT -q 0.001
+        python cli.py run -s BTCUSDT --strategy my_strategies:Breakout -q 0.001 -w 4
+    """
+    console.print()
+    console.print(Panel.fit(
+        "[bold cyan]🤖 Strategy Runner[/bold cyan]\n"
+        "[dim]Testnet Environment[/dim]",
+        border_style="cyan"
+    ))
+    console.print()
+
+    try:
+        validated_symbols = [validate_symbol(s) for s in symbols]
+        validated_quantity = validate_quantity(quantity)
+
+        runner = StrategyRunner(
+            symbols=validated_symbols,
+            strategy_spec=strategy,
+            quantity=validated_quantity,
+            workers=workers,
+            interval=interval,
+            max_orders_per_second=max_orders_per_second
+        )
+
+        table = Table(title="Runner Summary", show_header=True, header_style="bold magenta")
+        table.add_column("Parameter", style="cyan")
+        table.add_column("Value", style="yellow")
+
+        table.add_row("Strategy", strategy)
+        table.add_row("Symbols", ", ".join(runner.symbols))
+        table.add_row("Quantity", str(validated_quantity))
+        table.add_row("Workers", str(len(runner.shards)))
+        table.add_row("Interval", f"{interval}s")
+        table.add_row("Max Orders/s", str(max_orders_per_second))
+
+        console.print(table)
+        console.print()
+        console.print("[yellow]▶️  Running... press Ctrl+C to stop[/yellow]\n")
+
+        runner.run()
+
+        console.print()
+        console.print(f"[dim]📝 Detailed logs saved to: {log_file}[/dim]")
+        console.print()
+
+    except ValidationError as e:
+        console.print()
+        console.print(Panel.fit(
+            f"[bold red]✗ Validation Error[/bold red]\n\n{str(e)}",
+            border_style="red"
+        ))
+        console.print()
+        logger.error(f"Validation error: {e}")
+        sys.exit(1)
+
+    except ValueError as e:
+        console.print()
+        console.print(Panel.fit(
+            f"[bold red]✗ Configuration Error[/bold red]\n\n{str(e)}",
+            border_style="red"
+        ))
+        console.print()
+        logger.error(f"Configuration error: {e}")
+        sys.exit(1)
+
+    except RuntimeError as e:
+        console.print()
+        console.print(Panel.fit(
+            f"[bold red]✗ Runner Failed[/bold red]\n\n{str(e)}\n\n"
+            f"[dim]📝 Logs: {log_file}[/dim]",
+            border_style="red"
+        ))
+        console.print()
+        logger.error(f"Runner error: {e}")
+        sys.exit(1)
+
+    except Exception as e:
+        console.print()
+        console.print(Panel.fit(
+            f"[bold red]✗ Error[/bold red]\n\n{str(e)}",
+            border_style="red"
+        ))
+        console.print()
+        logger.error(f"Unexpected error: {e}", exc_info=True)
+        sys.exit(1)
+
 @app.command()
 def version():
     """Show version information."""
@@ -0,0 +1,372 @@
+"""
+Tests for the multi-symbol strategy runner.
+Binance is replaced by stub clients, so no credentials or network are needed.
+"""
+import multiprocessing as mp
+import queue
+import signal
+import threading
+import time
+import pytest
+from bot.runner import (
+    MarketDataBoard, OrderGateway, RateLimiter, StrategyRunner, run_worker, shard_symbols
+)
+from bot.strategy import OrderIntent, Strategy
+
+
+class StubClient:
+    def __init__(self, prices=None, clock=time.monotonic):
+        self.prices = prices if prices is not None else {"BTCUSDT": (100.0, 1.0)}
+        self.clock = clock
+        self.polls = []
+
+    def get_ticker_prices(self):
+        self.polls.append(self.clock())
+        return self.prices
+
+
+class FakeTime:
+    """Clock and sleep for OrderGateway that only advance when slept on."""
+
+    def __init__(self, until):
+        self.now = 0.0
+        self.until = until
+        self.stop = threading.Event()
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.advance(self.now + seconds)
+
+    def advance(self, to):
+        self.now = to
+        if self.now >= self.until:
+            self.stop.set()
+
+
+class ScriptedIntents:
+    """Intent queue whose items arrive at given FakeTime times."""
+
+    def __init__(self, fake, arrivals):
+        self.fake = fake
+        self.arrivals = sorted(arrivals, key=lambda a: a[0])
+
+    def get(self, timeout):
+        if self.arrivals and self.arrivals[0][0] <= self.fake.now + timeout:
+            at, item = self.arrivals.pop(0)
+            self.fake.advance(max(self.fake.now, at))
+            return item
+        self.fake.advance(self.fake.now + timeout)
+        raise queue.Empty
+
+
+class StubOrderManager:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.orders = []
+
+    def place_order(self, symbol, side, order_type, quantity, price=None):
+        if self.fail:
+            raise RuntimeError("API down")
+        self.orders.append((symbol, side, order_type, quantity, price))
+        return {"orderId": len(self.orders)}
+
+
+class IdleStrategy(Strategy):
+    def on_tick(self, price, timestamp):
+        return []
+
+
+class BrokenStrategy(Strategy):
+    def __init__(self, symbol, quantity):
+        raise ValueError("broken strategy")
+
+
+class CrossSymbolStrategy(Strategy):
+    """Emits one order for another symbol, spelled in lowercase."""
+
+    results = []
+
+    def __init__(self, symbol, quantity):
+        super().__init__(symbol, quantity)
+        self.sent = False
+
+    def on_tick(self, price, timestamp):
+        if self.sent:
+            return []
+        self.sent = True
+        return [OrderIntent("ethusdt", "BUY", "MARKET", self.quantity)]
+
+    def on_order_result(self, intent, response, error):
+        CrossSymbolStrategy.results.append((self.symbol, intent.symbol, response, error))
+
+
+class IntentQueue(queue.Queue):
+    def cancel_join_thread(self):
+        pass
+
+
+class GatewayLoopback:
+    """Worker results queue that passes sent intents straight through a gateway."""
+
+    def __init__(self, gateway, intents, replies):
+        self.gateway = gateway
+        self.intents = intents
+        self.replies = replies
+
+    def get_nowait(self):
+        try:
+            worker, key, intent = self.intents.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            if self.gateway.accept(worker, key, intent):
+                self.gateway.send_pending()
+        return self.replies.get_nowait()
+
+
+class StopWhenReported:
+    def __init__(self, timeout=5):
+        self.deadline = time.monotonic() + timeout
+
+    def is_set(self):
+        return bool(CrossSymbolStrategy.results) or time.monotonic() > self.deadline
+
+
+def connect_broken_prices():
+    # Not a (price, timestamp) pair, so publishing fails inside the gateway
+    return StubClient({"BTCUSDT": None}), StubOrderManager()
+
+
+def connect_idle():
+    return StubClient(), StubOrderManager()
+
+
+def connect_failing():
+    raise ValueError("API credentials not found")
+
+
+def read_in_child(name, symbols, symbol, out):
+    board = MarketDataBoard(symbols, name=name)
+    out.put(board.read(symbol))
+    board.close()
+
+
+@pytest.fixture
+def board():
+    board = MarketDataBoard(["BTCUSDT", "ETHUSDT"])
+    yield board
+    board.close()
+
+
+def make_gateway(board, client=None, order_manager=None, rate=100.0, interval=1.0, **kwargs):
+    results = [queue.Queue()]
+    gateway = OrderGateway(client or StubClient(), order_manager or StubOrderManager(),
+                           board, results, interval, rate, **kwargs)
+    return gateway, results[0]
+
+
+def buy(key="BTCUSDT"):
+    return (0, key, OrderIntent("BTCUSDT", "BUY", "MARKET", 0.01))
+
+
+def test_shard_symbols():
+    symbols = ["A", "B", "C", "D", "E"]
+    assert shard_symbols(symbols, 2) == [["A", "C", "E"], ["B", "D"]]
+    assert shard_symbols(symbols, 10) == [[s] for s in symbols]
+    assert shard_symbols(symbols, 0) == [symbols]
+
+
+def test_board_publish_and_read(board):
+    assert board.read("BTCUSDT") == (0.0, 0.0, 0.0)
+    board.publish("BTCUSDT", 101.5, 12.0)
+    board.publish("BTCUSDT", 102.5, 13.0)
+    assert board.read("BTCUSDT") == (4.0, 102.5, 13.0)
+    assert board.read("ETHUSDT") == (0.0, 0.0, 0.0)
+
+
+def test_board_attach_from_other_process(board):
+    board.publish("ETHUSDT", 2500.0, 7.0)
+    out = mp.Queue()
+    child = mp.Process(target=read_in_child, args=(board.name, board.symbols, "ETHUSDT", out))
+    child.start()
+    assert out.get(timeout=10) == (2.0, 2500.0, 7.0)
+    child.join(10)
+    assert child.exitcode == 0
+
+
+def test_board_read_gives_up_on_odd_sequence(board):
+    # Writer died mid-update
+    board.data[0] = 1.0
+    assert board.read("BTCUSDT") is None
+    assert board.read("ETHUSDT") == (0.0, 0.0, 0.0)
+
+
+def test_rate_limiter():
+    fake = FakeTime(until=60)
+    limiter = RateLimiter(10, clock=fake.clock)
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+    fake.sleep(0.04)
+    assert limiter.delay() == pytest.approx(0.06)
+    fake.sleep(limiter.delay())
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+
+def test_gateway_poll_publishes_prices(board):
+    gateway, _ = make_gateway(board, client=StubClient({"BTCUSDT": (100.0, 5.0)}))
+    gateway.poll_prices()
+    assert board.read("BTCUSDT") == (2.0, 100.0, 5.0)
+    assert board.read("ETHUSDT")[0] == 0.0
+    assert gateway.missing == {"ETHUSDT"}
+
+
+def test_gateway_places_order_and_reports(board):
+    orders = StubOrderManager()
+    gateway, results = make_gateway(board, order_manager=orders)
+    intent = OrderIntent("btcusdt", "buy", "market", 0.01)
+    assert gateway.accept(0, "BTCUSDT", intent)
+    assert gateway.send_pending()
+    assert orders.orders == [("BTCUSDT", "BUY", "MARKET", 0.01, None)]
+    assert results.get_nowait() == ("BTCUSDT", intent, {"orderId": 1}, None)
+
+
+def test_gateway_reports_to_emitting_strategy(board):
+    gateway, results = make_gateway(board)
+    intent = OrderIntent("ethusdt", "SELL", "MARKET", 0.01)
+    gateway.accept(0, "BTCUSDT", intent)
+    gateway.send_pending()
+    assert results.get_nowait()[:2] == ("BTCUSDT", intent)
+
+
+def test_gateway_rejects_invalid_intent(board):
+    gateway, results = make_gateway(board)
+    intent = OrderIntent("BTCUSDT", "HOLD", "MARKET", 0.01)
+    assert not gateway.accept(0, "BTCUSDT", intent)
+    assert gateway.pending is None
+    _, _, response, error = results.get_nowait()
+    assert response is None and "Invalid side" in error
+
+
+def test_gateway_reports_failed_order(board):
+    gateway, results = make_gateway(board, order_manager=StubOrderManager(fail=True))
+    gateway.accept(0, "BTCUSDT", OrderIntent("BTCUSDT", "BUY", "MARKET", 0.01))
+    assert gateway.send_pending()
+    assert results.get_nowait()[3] == "API down"
+
+
+def test_gateway_holds_intent_until_token_free(board):
+    orders = StubOrderManager()
+    gateway, _ = make_gateway(board, order_manager=orders, rate=10)
+    gateway.accept(0, "BTCUSDT", OrderIntent("BTCUSDT", "BUY", "MARKET", 0.01))
+    assert gateway.send_pending()
+    gateway.accept(0, "BTCUSDT", OrderIntent("BTCUSDT", "SELL", "MARKET", 0.01))
+    assert not gateway.send_pending()
+    assert gateway.pending is not None
+    time.sleep(gateway.limiter.delay() + 0.01)
+    assert gateway.send_pending()
+    assert len(orders.orders) == 2
+
+
+def test_gateway_drops_stale_intent(board):
+    orders = StubOrderManager()
+    gateway, results = make_gateway(board, order_manager=orders, interval=0.5)
+    intent = OrderIntent("BTCUSDT", "BUY", "MARKET", 0.01, created=time.time() - 1)
+    gateway.accept(0, "BTCUSDT", intent)
+    assert gateway.send_pending()
+    assert orders.orders == []
+    assert "expired" in results.get_nowait()[3]
+
+
+def test_gateway_polls_on_schedule_under_backpressure(board):
+    fake = FakeTime(until=1.05)
+    client = StubClient(clock=fake.clock)
+    orders = StubOrderManager()
+    gateway, _ = make_gateway(board, client=client, order_manager=orders, rate=2,
+                              interval=0.1, clock=fake.clock, sleep=fake.sleep)
+    intents = ScriptedIntents(fake, [(0.0, buy()) for _ in range(50)])
+
+    gateway.run(intents, fake.stop)
+
+    assert client.polls == pytest.approx([i / 10 for i in range(11)])
+    # One order at start, then one token every 0.5s
+    assert len(orders.orders) == 3
+
+
+def test_worker_routes_result_to_emitting_strategy(board):
+    CrossSymbolStrategy.results.clear()
+    orders = StubOrderManager()
+    gateway, replies = make_gateway(board, order_manager=orders)
+    intents = IntentQueue()
+    board.publish("BTCUSDT", 100.0, 1.0)
+
+    handler = signal.getsignal(signal.SIGINT)
+    try:
+        run_worker(board.name, board.symbols, ["BTCUSDT"], "tests.test_runner:CrossSymbolStrategy",
+                   0.01, 0, intents, GatewayLoopback(gateway, intents, replies),
+                   StopWhenReported(), 0.01)
+    finally:
+        signal.signal(signal.SIGINT, handler)
+
+    assert orders.orders == [("ETHUSDT", "BUY", "MARKET", 0.01, None)]
+    assert CrossSymbolStrategy.results == [("BTCUSDT", "ethusdt", {"orderId": 1}, None)]
+
+
+def test_gateway_polls_on_time_when_intent_arrives_late(board):
+    fake = FakeTime(until=4.5)
+    client = StubClient(clock=fake.clock)
+    orders = StubOrderManager()
+    gateway, _ = make_gateway(board, client=client, order_manager=orders, rate=0.5,
+                              interval=1.0, max_intent_age=60,
+                              clock=fake.clock, sleep=fake.sleep)
+    # The second intent arrives late in the interval while no token is free
+    intents = ScriptedIntents(fake, [(0.05, buy()), (0.9, buy())])
+
+    gateway.run(intents, fake.stop)
+
+    assert client.polls == pytest.approx([0.0, 1.0, 2.0, 3.0, 4.0])
+    assert len(orders.orders) == 2
+
+
+@pytest.mark.parametrize("kwargs,message", [
+    ({"symbols": []}, "At least one symbol"),
+    ({"workers": 0}, "Workers must be at least 1"),
+    ({"interval": 0}, "Interval must be positive"),
+    ({"max_orders_per_second": 0}, "Order rate must be positive"),
+    ({"strategy_spec": "nope"}, "Invalid strategy"),
+])
+def test_runner_validates_arguments(kwargs, message):
+    args = {"symbols": ["BTCUSDT"], "strategy_spec": "tests.test_runner:IdleStrategy",
+            "quantity": 0.01}
+    args.update(kwargs)
+    with pytest.raises(ValueError, match=message):
+        StrategyRunner(**args)
+
+
+def test_runner_dedupes_and_shards_symbols():
+    runner = StrategyRunner(["A", "B", "A", "C"], "tests.test_runner:IdleStrategy", 1, workers=2)
+    assert runner.symbols == ["A", "B", "C"]
+    assert runner.shards == [["A", "C"], ["B"]]
+
+
+def test_runner_raises_when_worker_fails():
+    runner = StrategyRunner(["BTCUSDT"], "tests.test_runner:BrokenStrategy", 0.01,
+                            workers=1, interval=0.1, connect=connect_idle)
+    with pytest.raises(RuntimeError, match=r"strategy-worker-0 \(exit code 1\)"):
+        runner.run()
+
+
+def test_runner_raises_when_gateway_fails():
+    runner = StrategyRunner(["BTCUSDT"], "tests.test_runner:IdleStrategy", 0.01,
+                            workers=1, interval=0.1, connect=connect_broken_prices)
+    with pytest.raises(RuntimeError, match=r"order-gateway \(exit code 1\)"):
+        runner.run()
+
+
+def test_runner_raises_when_gateway_cannot_start():
+    runner = StrategyRunner(["BTCUSDT"], "tests.test_runner:IdleStrategy", 0.01,
+                            workers=1, connect=connect_failing)
+    with pytest.raises(RuntimeError, match="failed to start"):
+        runner.run()
@@ -0,0 +1,80 @@
+"""
+Tests for the strategy plugin interface.
+"""
+import time
+import pytest
+from bot.strategy import OrderIntent, SMACrossStrategy, Strategy, load_strategy
+
+NOT_A_STRATEGY = 42
+
+
+class Dummy(Strategy):
+    def on_tick(self, price, timestamp):
+        return [self.market("BUY")]
+
+
+def feed(strategy, prices):
+    intents = []
+    for price in prices:
+        intents.extend(strategy.on_tick(price, time.time()))
+    return intents
+
+
+def test_load_strategy():
+    assert load_strategy("bot.strategy:SMACrossStrategy") is SMACrossStrategy
+    assert load_strategy("tests.test_strategy:Dummy") is Dummy
+
+
+@pytest.mark.parametrize("spec", ["bot.strategy", "bot.strategy:", ":Dummy", ""])
+def test_load_strategy_bad_spec(spec):
+    with pytest.raises(ValueError, match="Invalid strategy"):
+        load_strategy(spec)
+
+
+def test_load_strategy_import_failure():
+    with pytest.raises(ValueError, match="Cannot import"):
+        load_strategy("no_such_module:Dummy")
+
+
+@pytest.mark.parametrize("name", ["NOT_A_STRATEGY", "OrderIntent", "Missing"])
+def test_load_strategy_not_a_strategy(name):
+    with pytest.raises(ValueError, match="not a Strategy subclass"):
+        load_strategy(f"tests.test_strategy:{name}")
+
+
+def test_intent_helpers():
+    strategy = Dummy("BTCUSDT", 0.5)
+    before = time.time()
+    intent = strategy.limit("SELL", 100.0)
+    assert (intent.symbol, intent.side, intent.order_type, intent.quantity, intent.price) == \
+        ("BTCUSDT", "SELL", "LIMIT", 0.5, 100.0)
+    assert intent.created >= before
+    assert strategy.market("BUY", 2).quantity == 2
+
+
+@pytest.mark.parametrize("fast,slow", [(0, 5), (5, 5), (6, 5), (-1, 5)])
+def test_sma_invalid_periods(fast, slow):
+    with pytest.raises(ValueError, match="0 < fast < slow"):
+        SMACrossStrategy("BTCUSDT", 1, fast=fast, slow=slow)
+
+
+def test_sma_position_follows_order_results():
+    strategy = SMACrossStrategy("BTCUSDT", 1, fast=2, slow=4)
+    intents = feed(strategy, [1, 1, 1, 5])
+    assert [i.side for i in intents] == ["BUY"]
+
+    # No new orders while one is outstanding
+    assert feed(strategy, [6, 7]) == []
+
+    # A rejected order leaves the position flat, so the strategy re-enters
+    strategy.on_order_result(intents[0], None, "Intent expired")
+    assert strategy.position is None
+    intents = feed(strategy, [8])
+    assert [i.side for i in intents] == ["BUY"]
+
+    strategy.on_order_result(intents[0], {"orderId": 1}, None)
+    assert strategy.position == "LONG"
+    intents = feed(strategy, [1, 1])
+    assert [i.side for i in intents] == ["SELL"]
+    strategy.on_order_result(intents[0], {"orderId": 2}, None)
+    assert strategy.position is None